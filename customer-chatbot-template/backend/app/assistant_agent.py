@@ -8,10 +8,14 @@ CUSTOMIZATION POINTS:
 1. config.ASSISTANT_INSTRUCTIONS - Define how the assistant behaves
 2. config.ASSISTANT_MODEL - Choose the AI model (gpt-4.1-mini, gpt-4o, etc.)
 3. config.ASSISTANT_NAME - Give your assistant a custom name
-4. config.MAX_SEARCH_RESULTS - Control how many document chunks are retrieved
+4. config.MAX_SEARCH_RESULTS_DEFAULT - Control how many document chunks are retrieved
+5. retrieval_policy.choose_k - Adapt the number of chunks to each question
 """
 from __future__ import annotations
 
+import functools
+from typing import Any
+
 from agents import Agent
 from agents.models.openai_responses import FileSearchTool
 from chatkit.agents import AgentContext
@@ -20,12 +24,13 @@ from .config import (
     ASSISTANT_INSTRUCTIONS,
     ASSISTANT_MODEL,
     ASSISTANT_NAME,
-    MAX_SEARCH_RESULTS,
+    MAX_SEARCH_RESULTS_DEFAULT,
     VECTOR_STORE_ID,
 )
 
 
-def build_file_search_tool() -> FileSearchTool:
+@functools.lru_cache(maxsize=16)
+def build_file_search_tool(k: int = MAX_SEARCH_RESULTS_DEFAULT) -> FileSearchTool:
     """
     Creates the File Search tool that enables the assistant to retrieve
     relevant information from your document vector store.
@@ -35,6 +40,12 @@ def build_file_search_tool() -> FileSearchTool:
     - Returns the most relevant chunks based on semantic similarity
     - Provides page/section references for citations
 
+    Tools are memoized per k, so every turn (and every caller) that asks for
+    the same number of results shares one instance. Treat it as read-only.
+
+    Args:
+        k: Maximum number of document chunks to retrieve per search
+
     Returns:
         FileSearchTool configured with your vector store
 
@@ -50,37 +61,71 @@ def build_file_search_tool() -> FileSearchTool:
 
     return FileSearchTool(
         vector_store_ids=[VECTOR_STORE_ID],
-        max_num_results=MAX_SEARCH_RESULTS,
+        max_num_results=k,
     )
 
 
+def with_search_results(agent: Agent[AgentContext], k: int) -> Agent[AgentContext]:
+    """
+    Return a copy of the agent whose File Search tool retrieves k chunks.
+
+    Used per turn with retrieval_policy.choose_k(). Other tools are kept as-is.
+
+    Args:
+        agent: The base assistant agent
+        k: Number of document chunks to retrieve (at least 1)
+
+    Returns:
+        The same agent if it already retrieves k chunks, otherwise a clone
+    """
+    search_tools = [tool for tool in agent.tools if isinstance(tool, FileSearchTool)]
+    if all(tool.max_num_results == k for tool in search_tools):
+        return agent
+
+    other_tools = [tool for tool in agent.tools if not isinstance(tool, FileSearchTool)]
+    return agent.clone(tools=[*other_tools, build_file_search_tool(k)])
+
+
 # ==============================================================================
 # MAIN ASSISTANT AGENT
 # ==============================================================================
 
-assistant_agent = Agent[AgentContext](
-    model=ASSISTANT_MODEL,
-    name=ASSISTANT_NAME,
-    instructions=ASSISTANT_INSTRUCTIONS,
-    tools=[build_file_search_tool()],
-)
+@functools.lru_cache(maxsize=1)
+def get_assistant_agent() -> Agent[AgentContext]:
+    """
+    Return the assistant agent, building it on first use.
+
+    The assistant agent is the core of your chatbot. It combines:
+    - A language model (GPT-4.1-mini by default) for response generation
+    - File Search tool for retrieving relevant document chunks
+    - Custom instructions that enforce citation behavior and response style
+
+    The agent will:
+    1. Receive user questions
+    2. Search the vector store for relevant information
+    3. Generate responses grounded in the retrieved documents
+    4. Include citations to source documents
+
+    Construction is deferred so importing this module (e.g. from scripts) does
+    not build the agent or validate VECTOR_STORE_ID until it is actually needed.
+    """
+    return Agent[AgentContext](
+        model=ASSISTANT_MODEL,
+        name=ASSISTANT_NAME,
+        instructions=ASSISTANT_INSTRUCTIONS,
+        tools=[build_file_search_tool()],
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Keep `from .assistant_agent import assistant_agent` working (built lazily)."""
+    if name == "assistant_agent":
+        return get_assistant_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-"""
-The assistant_agent is the core of your chatbot.
-
-It combines:
-- A language model (GPT-4.1-mini by default) for response generation
-- File Search tool for retrieving relevant document chunks
-- Custom instructions that enforce citation behavior and response style
-
-The agent will:
-1. Receive user questions
-2. Search the vector store for relevant information
-3. Generate responses grounded in the retrieved documents
-4. Include citations to source documents
-"""
 
 __all__ = [
-    "assistant_agent",
     "build_file_search_tool",
+    "get_assistant_agent",
+    "with_search_results",
 ]
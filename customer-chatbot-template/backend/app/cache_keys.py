@@ -0,0 +1,27 @@
+"""
+Cache Key Normalization
+
+Single normalization step shared by the exact-match response cache and the
+semantic cache, so both see the same canonical form of a user message:
+- Unicode NFKC normalization (e.g. full-width characters, ligatures)
+- Leading/trailing whitespace removed, inner whitespace collapsed
+- Lowercased
+
+Results are memoized, so repeated questions are normalized only once.
+"""
+from __future__ import annotations
+
+import functools
+import re
+import unicodedata
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize(message: str) -> str:
+    """Return the canonical form of a user message used for cache lookups."""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", message).strip().lower())
+
+
+__all__ = ["normalize"]
@@ -9,6 +9,7 @@ CUSTOMIZATION INSTRUCTIONS:
 from __future__ import annotations
 
 import os
+import sys
 from pathlib import Path
 
 # ==============================================================================
@@ -54,20 +55,85 @@ ASSISTANT_MODEL = os.getenv("ASSISTANT_MODEL", "gpt-4.1-mini")
 # For creative applications, increase (0.5-0.9)
 ASSISTANT_TEMPERATURE = float(os.getenv("ASSISTANT_TEMPERATURE", "0.3"))
 
-# CUSTOMIZE: Maximum number of document chunks to retrieve per query
+# The File Search tool accepts between 1 and 50 results per query
+_FILE_SEARCH_MAX_RESULTS = 50
+
+# CUSTOMIZE: Number of document chunks to retrieve per query
 # Higher = more context but slower and more expensive
 # Recommended: 3-10
-MAX_SEARCH_RESULTS = int(os.getenv("MAX_SEARCH_RESULTS", "5"))
+_MAX_SEARCH_RESULTS = int(os.getenv("MAX_SEARCH_RESULTS", "5"))
+
+# Upper bound on chunks retrieved for any question (clamped to 1-50)
+# Defaults to 10, or to MAX_SEARCH_RESULTS when that is larger
+MAX_SEARCH_RESULTS_LIMIT = min(
+    max(int(os.getenv("MAX_SEARCH_RESULTS_LIMIT", str(max(10, _MAX_SEARCH_RESULTS)))), 1),
+    _FILE_SEARCH_MAX_RESULTS,
+)
+
+# Default chunks per query, kept within 1-MAX_SEARCH_RESULTS_LIMIT
+MAX_SEARCH_RESULTS_DEFAULT = min(max(_MAX_SEARCH_RESULTS, 1), MAX_SEARCH_RESULTS_LIMIT)
+
+# CUSTOMIZE: Pick the number of chunks per query based on the question
+# (fewer for short factual questions, more for long/complex ones - see retrieval_policy.py)
+# Set to false to always retrieve MAX_SEARCH_RESULTS chunks
+ADAPTIVE_SEARCH_RESULTS = (
+    os.getenv("ADAPTIVE_SEARCH_RESULTS", "true").strip().lower() in {"1", "true", "yes", "on"}
+)
+
+# ==============================================================================
+# RESPONSE CACHE
+# ==============================================================================
+
+# CUSTOMIZE: Replay cached answers for repeated questions instead of calling the model
+# Disable when documents change frequently or answers must always be fresh
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").strip().lower() in {"1", "true", "yes", "on"}
+
+# Maximum number of cached responses kept in memory (least recently used are evicted)
+# 0 disables the response cache
+CACHE_MAX_SIZE = int(os.getenv("CACHE_MAX_SIZE", "1000"))
+if CACHE_MAX_SIZE < 0:
+    raise RuntimeError("CACHE_MAX_SIZE must be 0 or greater.")
+
+# How long a cached response stays valid, in seconds
+CACHE_TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", "3600"))
+
+# CUSTOMIZE: Also reuse answers for paraphrased questions (embedding similarity)
+# Opt-in: adds one embeddings call per uncached question, and a hit replays the
+# answer to a different (but similar) question. Requires CACHE_ENABLED
+SEMANTIC_CACHE_ENABLED = (
+    os.getenv("SEMANTIC_CACHE_ENABLED", "false").strip().lower() in {"1", "true", "yes", "on"}
+)
+
+# Maximum number of semantically cached responses (oldest are overwritten)
+# 0 disables the semantic cache
+SEMANTIC_CACHE_MAX_SIZE = int(os.getenv("SEMANTIC_CACHE_MAX_SIZE", "2000"))
+if SEMANTIC_CACHE_MAX_SIZE < 0:
+    raise RuntimeError("SEMANTIC_CACHE_MAX_SIZE must be 0 or greater.")
+
+# Embedding model used for semantic cache lookups
+SEMANTIC_CACHE_EMBEDDING_MODEL = os.getenv(
+    "SEMANTIC_CACHE_EMBEDDING_MODEL", "text-embedding-3-small"
+)
+
+# Minimum cosine similarity (0.0-1.0) for two questions to share an answer
+# Higher = fewer but safer hits. Recommended: 0.90-0.95
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+
+# How long a semantically cached response stays valid, in seconds
+SEMANTIC_CACHE_TTL = float(os.getenv("SEMANTIC_CACHE_TTL", "600"))
 
 # ==============================================================================
 # ASSISTANT INSTRUCTIONS
 # ==============================================================================
 
 # CUSTOMIZE: These instructions define how your assistant behaves
-# Modify this template for your specific domain and requirements
-ASSISTANT_INSTRUCTIONS_TEMPLATE = """
-You are a **{assistant_name}**.
-
+# Modify this block for your specific domain and requirements
+#
+# PROMPT CACHING: OpenAI caches requests that share an identical prompt prefix,
+# which lowers latency and input-token cost. Keep this block free of per-deployment
+# values (no {placeholders}) so it is byte-identical on every request, and append
+# any dynamic content after it (see ASSISTANT_IDENTITY_TEMPLATE) - never prepend.
+ASSISTANT_INSTRUCTIONS_STATIC_PREFIX = """
 **Your task**
 - Always call the `file_search` tool before responding. Use the passages it returns as your evidence.
 - Compose a concise answer (2–4 sentences) grounded **only** in the retrieved passages.
@@ -86,9 +152,15 @@ You are a **{assistant_name}**.
 Limit the entire response with citations to 2-4 sentences.
 """.strip()
 
-# Generate the final instructions by substituting variables
-ASSISTANT_INSTRUCTIONS = ASSISTANT_INSTRUCTIONS_TEMPLATE.format(
-    assistant_name=ASSISTANT_NAME
+# Dynamic, per-deployment part of the instructions (appended after the static prefix)
+ASSISTANT_IDENTITY_TEMPLATE = "Assistant identity: You are a **{assistant_name}**."
+
+# Generate the final instructions: static prefix first, dynamic values last
+# Built once at import and interned so every request reuses the same string object
+ASSISTANT_INSTRUCTIONS = sys.intern(
+    ASSISTANT_INSTRUCTIONS_STATIC_PREFIX
+    + "\n\n"
+    + ASSISTANT_IDENTITY_TEMPLATE.format(assistant_name=ASSISTANT_NAME)
 )
 
 # ==============================================================================
@@ -100,7 +172,13 @@ SERVER_HOST = os.getenv("SERVER_HOST", "127.0.0.1")
 SERVER_PORT = int(os.getenv("SERVER_PORT", "8002"))
 
 # CORS settings (for production, restrict to your frontend domain)
-CORS_ORIGINS = os.getenv("CORS_ORIGINS", "*").split(",")
+# Comma-separated; whitespace around entries is ignored
+CORS_ORIGINS: frozenset[str] = frozenset(
+    origin.strip() for origin in os.getenv("CORS_ORIGINS", "*").split(",") if origin.strip()
+)
+
+# True when any origin is allowed ("*"), so origin checks can be skipped entirely
+CORS_ALLOW_ALL: bool = "*" in CORS_ORIGINS
 
 # ==============================================================================
 # FILE PATHS
@@ -125,11 +203,24 @@ __all__ = [
     "ASSISTANT_NAME",
     "ASSISTANT_MODEL",
     "ASSISTANT_TEMPERATURE",
+    "ASSISTANT_INSTRUCTIONS_STATIC_PREFIX",
+    "ASSISTANT_IDENTITY_TEMPLATE",
     "ASSISTANT_INSTRUCTIONS",
-    "MAX_SEARCH_RESULTS",
+    "MAX_SEARCH_RESULTS_LIMIT",
+    "MAX_SEARCH_RESULTS_DEFAULT",
+    "ADAPTIVE_SEARCH_RESULTS",
+    "CACHE_ENABLED",
+    "CACHE_MAX_SIZE",
+    "CACHE_TTL_SECONDS",
+    "SEMANTIC_CACHE_ENABLED",
+    "SEMANTIC_CACHE_MAX_SIZE",
+    "SEMANTIC_CACHE_EMBEDDING_MODEL",
+    "SEMANTIC_CACHE_THRESHOLD",
+    "SEMANTIC_CACHE_TTL",
     "SERVER_HOST",
     "SERVER_PORT",
     "CORS_ORIGINS",
+    "CORS_ALLOW_ALL",
     "DATA_DIR",
     "LOG_LEVEL",
 ]
@@ -14,19 +14,38 @@ CUSTOMIZATION:
 """
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+import hashlib
+import pickle
+import re
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import asdict, astuple, dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable
+from types import ModuleType
 
+_fuzzy_process: ModuleType | None
+try:
+    from rapidfuzz import process as _fuzzy_process
+    from rapidfuzz.distance import Levenshtein as _Levenshtein
+except ImportError:  # Optional: pip install rapidfuzz enables typo-tolerant lookups
+    _fuzzy_process = None
 
-def _normalise(value: str) -> str:
+
+# Runs of characters that are not alphanumeric (same set as `not str.isalnum()`)
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+
+
+@lru_cache(maxsize=4096)
+def normalise_text(value: str) -> str:
     """Normalize string for matching (lowercase, trimmed)."""
     return value.strip().lower()
 
 
-def _slugify(value: str) -> str:
+@lru_cache(maxsize=4096)
+def slugify_text(value: str) -> str:
     """Convert string to alphanumeric-only slug for fuzzy matching."""
-    return "".join(ch for ch in value.lower() if ch.isalnum())
+    return _NON_ALNUM_RE.sub("", value.lower())
 
 
 @dataclass(frozen=True, slots=True)
@@ -45,6 +64,11 @@ class DocumentMetadata:
     title: str
     description: str | None = None
 
+    def __post_init__(self) -> None:
+        # Intern identifying strings so repeated values share a single object
+        for name in ("id", "filename", "title"):
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+
     @property
     def stem(self) -> str:
         """Filename without extension (e.g., 'document.pdf' -> 'document')."""
@@ -69,35 +93,121 @@ DOCUMENTS: tuple[DocumentMetadata, ...] = (
 )
 
 # ==============================================================================
-# DOCUMENT LOOKUP INDICES
+# DOCUMENT LOOKUP INDEX
 # ==============================================================================
-# These dictionaries enable fast document lookups by various keys
-# They are automatically built from the DOCUMENTS tuple above
-
-DOCUMENTS_BY_ID: dict[str, DocumentMetadata] = {
-    doc.id: doc for doc in DOCUMENTS
-}
-
-DOCUMENTS_BY_FILENAME: dict[str, DocumentMetadata] = {
-    _normalise(doc.filename): doc for doc in DOCUMENTS
-}
-
-DOCUMENTS_BY_STEM: dict[str, DocumentMetadata] = {
-    _normalise(doc.stem): doc for doc in DOCUMENTS
-}
-
-# Build a fuzzy matching index using slugified versions of all text fields
-DOCUMENTS_BY_SLUG: dict[str, DocumentMetadata] = {}
-for document in DOCUMENTS:
-    for candidate in {
-        document.id,
-        document.filename,
-        document.stem,
-        document.title,
-        document.description or "",
-    }:
-        if candidate:
-            DOCUMENTS_BY_SLUG.setdefault(_slugify(candidate), document)
+# A single dictionary enables fast document lookups by every key kind.
+# Keys carry a prefix so different kinds never collide:
+#   "id:<id>", "fn:<filename>", "st:<stem>", "sl:<slug>"
+# It is automatically built from the DOCUMENTS tuple above, or loaded from the
+# documents.pkl file the setup script writes when it still matches DOCUMENTS
+
+_ID_KEY = "id:"
+_FILENAME_KEY = "fn:"
+_STEM_KEY = "st:"
+_SLUG_KEY = "sl:"
+
+# Prebuilt index written by scripts/setup-vector-store.py next to this file
+_INDEX_CACHE_PATH = Path(__file__).with_suffix(".pkl")
+# Bump when the layout of the pickled payload changes
+_INDEX_CACHE_FORMAT = 1
+
+
+def _build_index(documents: tuple[DocumentMetadata, ...]) -> dict[str, DocumentMetadata]:
+    """Build the lookup index from scratch."""
+    index: dict[str, DocumentMetadata] = {}
+    for document in documents:
+        stem = document.stem  # derived property: compute once per document
+        index[_ID_KEY + document.id] = document
+        index[_FILENAME_KEY + normalise_text(document.filename)] = document
+        index[_STEM_KEY + normalise_text(stem)] = document
+        # Fuzzy matching keys using slugified versions of all text fields
+        # (duplicates are harmless: setdefault keeps the first match)
+        for candidate in (
+            document.id,
+            document.filename,
+            stem,
+            document.title,
+            document.description,
+        ):
+            if candidate:
+                index.setdefault(_SLUG_KEY + slugify_text(candidate), document)
+    return index
+
+
+def _source_digest() -> str:
+    """SHA-256 of this source file; any edit (e.g. to the key builders) invalidates the cache."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def _load_index(documents: tuple[DocumentMetadata, ...]) -> dict[str, DocumentMetadata] | None:
+    """Load the prebuilt index, or None if it is missing, stale or malformed."""
+    try:
+        with _INDEX_CACHE_PATH.open("rb") as fh:
+            cached = pickle.load(fh)
+        if (
+            cached["format"] != _INDEX_CACHE_FORMAT
+            or cached["source"] != _source_digest()
+            or cached["documents"] != [astuple(document) for document in documents]
+        ):
+            return None
+        index: dict[str, DocumentMetadata] = {}
+        for key, position in cached["index"].items():
+            if not (isinstance(key, str) and 0 <= position < len(documents)):
+                return None
+            index[key] = documents[position]
+        return index
+    except Exception:  # Unreadable or unexpected payload: rebuild from source instead
+        return None
+
+
+def _write_index_cache() -> None:
+    """Pickle DOCUMENTS_INDEX so later imports can skip rebuilding it."""
+    positions = {id(document): position for position, document in enumerate(DOCUMENTS)}
+    payload = {
+        "format": _INDEX_CACHE_FORMAT,
+        "source": _source_digest(),
+        "documents": [astuple(document) for document in DOCUMENTS],
+        "index": {key: positions[id(document)] for key, document in DOCUMENTS_INDEX.items()},
+    }
+    with _INDEX_CACHE_PATH.open("wb") as fh:
+        pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+DOCUMENTS_INDEX: dict[str, DocumentMetadata] = _load_index(DOCUMENTS) or _build_index(DOCUMENTS)
+
+
+class _IndexView(Mapping[str, DocumentMetadata]):
+    """Read-only view of DOCUMENTS_INDEX restricted to one key prefix."""
+
+    __slots__ = ("_prefix",)
+
+    def __init__(self, prefix: str) -> None:
+        self._prefix = prefix
+
+    def __getitem__(self, key: str) -> DocumentMetadata:
+        return DOCUMENTS_INDEX[self._prefix + key]
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._prefix + key in DOCUMENTS_INDEX
+
+    def __iter__(self) -> Iterator[str]:
+        size = len(self._prefix)
+        return (key[size:] for key in DOCUMENTS_INDEX if key.startswith(self._prefix))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+# Per-kind lookups (kept for existing callers; no extra hash tables are built)
+DOCUMENTS_BY_ID: Mapping[str, DocumentMetadata] = _IndexView(_ID_KEY)
+DOCUMENTS_BY_FILENAME: Mapping[str, DocumentMetadata] = _IndexView(_FILENAME_KEY)
+DOCUMENTS_BY_STEM: Mapping[str, DocumentMetadata] = _IndexView(_STEM_KEY)
+DOCUMENTS_BY_SLUG: Mapping[str, DocumentMetadata] = _IndexView(_SLUG_KEY)
+
+# Candidate slugs for the fuzzy fallback in find_document()
+_FUZZY_CHOICES: tuple[str, ...] = tuple(DOCUMENTS_BY_SLUG)
+# Slugs shorter than this are too ambiguous to match approximately
+_FUZZY_MIN_LENGTH = 4
 
 
 # ==============================================================================
@@ -117,6 +227,27 @@ def as_dicts(documents: Iterable[DocumentMetadata]) -> list[dict[str, str | None
     return [asdict(document) for document in documents]
 
 
+def _fuzzy_find(slug: str) -> DocumentMetadata | None:
+    """
+    Return the document whose slug is closest to `slug`, within a small edit distance.
+
+    The distance cutoff (a quarter of the slug length, at least 2) lets rapidfuzz
+    abandon candidates early, so the fallback stays cheap for large registries.
+    Returns None when rapidfuzz is not installed.
+    """
+    if _fuzzy_process is None or len(slug) < _FUZZY_MIN_LENGTH:
+        return None
+    match = _fuzzy_process.extractOne(
+        slug,
+        _FUZZY_CHOICES,
+        scorer=_Levenshtein.distance,
+        score_cutoff=max(len(slug) // 4, 2),
+    )
+    if match is None:
+        return None
+    return DOCUMENTS_INDEX[_SLUG_KEY + match[0]]
+
+
 def find_document(query: str) -> DocumentMetadata | None:
     """
     Find a document by trying multiple matching strategies.
@@ -126,6 +257,7 @@ def find_document(query: str) -> DocumentMetadata | None:
     2. Exact filename match (case-insensitive)
     3. Filename stem match (without extension)
     4. Fuzzy slug match (alphanumeric only)
+    5. Closest slug within a small edit distance (if rapidfuzz is installed)
 
     Args:
         query: Search string (ID, filename, or partial text)
@@ -133,25 +265,26 @@ def find_document(query: str) -> DocumentMetadata | None:
     Returns:
         DocumentMetadata if found, None otherwise
     """
-    # Try exact ID
-    if query in DOCUMENTS_BY_ID:
-        return DOCUMENTS_BY_ID[query]
-
-    # Try normalized filename
-    normalized = _normalise(query)
-    if normalized in DOCUMENTS_BY_FILENAME:
-        return DOCUMENTS_BY_FILENAME[normalized]
+    # Exact ID or already-normalized filename: no normalization needed
+    document = DOCUMENTS_INDEX.get(_ID_KEY + query) or DOCUMENTS_INDEX.get(
+        _FILENAME_KEY + query
+    )
+    if document is not None:
+        return document
 
-    # Try filename stem
-    if normalized in DOCUMENTS_BY_STEM:
-        return DOCUMENTS_BY_STEM[normalized]
+    normalized = normalise_text(query)
+    document = DOCUMENTS_INDEX.get(_FILENAME_KEY + normalized) or DOCUMENTS_INDEX.get(
+        _STEM_KEY + normalized
+    )
+    if document is not None:
+        return document
 
-    # Try fuzzy slug matching
-    slug = _slugify(query)
-    if slug in DOCUMENTS_BY_SLUG:
-        return DOCUMENTS_BY_SLUG[slug]
+    slug = slugify_text(query)
+    document = DOCUMENTS_INDEX.get(_SLUG_KEY + slug)
+    if document is not None:
+        return document
 
-    return None
+    return _fuzzy_find(slug)
 
 
 __all__ = [
@@ -160,7 +293,10 @@ __all__ = [
     "DOCUMENTS_BY_ID",
     "DOCUMENTS_BY_STEM",
     "DOCUMENTS_BY_SLUG",
+    "DOCUMENTS_INDEX",
     "DocumentMetadata",
     "as_dicts",
     "find_document",
+    "normalise_text",
+    "slugify_text",
 ]
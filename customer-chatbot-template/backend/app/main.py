@@ -24,8 +24,10 @@ API ENDPOINTS:
 """
 from __future__ import annotations
 
+import logging
 import mimetypes
 import re
+from datetime import datetime
 from itertools import chain
 from pathlib import Path
 from typing import Any, AsyncIterator, Iterable
@@ -41,6 +43,7 @@ from chatkit.types import (
     Attachment,
     ClientToolCallItem,
     ThreadItem,
+    ThreadItemDoneEvent,
     ThreadMetadata,
     ThreadStreamEvent,
     UserMessageItem,
@@ -48,11 +51,29 @@ from chatkit.types import (
 from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, Response, StreamingResponse
+from openai import OpenAIError
 from openai.types.responses import ResponseInputContentParam
 from starlette.responses import JSONResponse
 
-from .assistant_agent import assistant_agent
-from .config import ASSISTANT_TEMPERATURE, CORS_ORIGINS, DATA_DIR
+from .assistant_agent import get_assistant_agent, with_search_results
+from .cache_keys import normalize
+from .config import (
+    ASSISTANT_INSTRUCTIONS,
+    ASSISTANT_MODEL,
+    ASSISTANT_TEMPERATURE,
+    CACHE_ENABLED,
+    CACHE_MAX_SIZE,
+    CACHE_TTL_SECONDS,
+    CORS_ALLOW_ALL,
+    CORS_ORIGINS,
+    DATA_DIR,
+    SEMANTIC_CACHE_EMBEDDING_MODEL,
+    SEMANTIC_CACHE_ENABLED,
+    SEMANTIC_CACHE_MAX_SIZE,
+    SEMANTIC_CACHE_THRESHOLD,
+    SEMANTIC_CACHE_TTL,
+    VECTOR_STORE_ID,
+)
 from .documents import (
     DOCUMENTS,
     DOCUMENTS_BY_FILENAME,
@@ -61,8 +82,15 @@ from .documents import (
     DOCUMENTS_BY_STEM,
     DocumentMetadata,
     as_dicts,
+    normalise_text,
+    slugify_text,
 )
 from .memory_store import MemoryStore
+from .response_cache import LLMCache
+from .retrieval_policy import choose_k
+from .semantic_cache import OpenAIEmbedder, SemanticCache
+
+logger = logging.getLogger(__name__)
 
 
 # ==============================================================================
@@ -71,14 +99,14 @@ from .memory_store import MemoryStore
 
 def _normalise_filename(value: str) -> str:
     """Extract and normalize filename for matching."""
-    return Path(value).name.strip().lower()
+    return normalise_text(Path(value).name)
 
 
 def _slug(value: str | None) -> str:
     """Convert string to alphanumeric slug for fuzzy matching."""
     if not value:
         return ""
-    return "".join(ch for ch in value.lower() if ch.isalnum())
+    return slugify_text(value)
 
 
 def _user_message_text(item: UserMessageItem) -> str:
@@ -96,6 +124,32 @@ def _user_message_text(item: UserMessageItem) -> str:
     return " ".join(parts).strip()
 
 
+def _response_cache_key(normalized_message: str, search_results: int) -> str:
+    """
+    Build the response cache key for a user message.
+
+    The key covers everything that shapes the answer (model, instructions,
+    retrieval settings) so changing the configuration never serves stale replies.
+    Expects the message already passed through cache_keys.normalize(), so
+    trivially different inputs (case, whitespace, Unicode forms) share a key.
+    """
+    return LLMCache.cache_key(
+        model=ASSISTANT_MODEL,
+        messages=[
+            {"role": "system", "content": ASSISTANT_INSTRUCTIONS},
+            {"role": "user", "content": normalized_message},
+        ],
+        tools=[
+            {
+                "type": "file_search",
+                "vector_store_ids": [VECTOR_STORE_ID],
+                "max_num_results": search_results,
+            }
+        ],
+        settings={"temperature": ASSISTANT_TEMPERATURE},
+    )
+
+
 def _resolve_document(annotation: Annotation) -> DocumentMetadata | None:
     """
     Resolve a citation annotation to a document from our metadata registry.
@@ -221,6 +275,21 @@ class KnowledgeAssistantServer(ChatKitServer[dict[str, Any]]):
         self.store = MemoryStore()
         super().__init__(self.store)
         self.assistant = agent
+        self.response_cache = (
+            LLMCache(max_size=CACHE_MAX_SIZE, ttl_seconds=CACHE_TTL_SECONDS)
+            if CACHE_ENABLED and CACHE_MAX_SIZE > 0
+            else None
+        )
+        self.semantic_cache = (
+            SemanticCache(
+                OpenAIEmbedder(model=SEMANTIC_CACHE_EMBEDDING_MODEL),
+                threshold=SEMANTIC_CACHE_THRESHOLD,
+                max_size=SEMANTIC_CACHE_MAX_SIZE,
+                ttl=SEMANTIC_CACHE_TTL,
+            )
+            if CACHE_ENABLED and SEMANTIC_CACHE_ENABLED and SEMANTIC_CACHE_MAX_SIZE > 0
+            else None
+        )
 
     async def respond(
         self,
@@ -234,9 +303,12 @@ class KnowledgeAssistantServer(ChatKitServer[dict[str, Any]]):
         This is the core of the ChatKit server. It:
         1. Validates the incoming item is a user message
         2. Extracts the text content
-        3. Creates agent context with thread and store
-        4. Runs the agent with streaming enabled
-        5. Streams events back to the client
+        3. Replays a cached answer if the same (or a very similar) question
+           was asked recently
+        4. Creates agent context with thread and store
+        5. Runs the agent with streaming enabled, retrieving a number of
+           document chunks suited to the question (retrieval_policy.py)
+        6. Streams events back to the client (and caches the final answer)
 
         Args:
             thread: Metadata for the current conversation thread
@@ -263,6 +335,36 @@ class KnowledgeAssistantServer(ChatKitServer[dict[str, Any]]):
         if not message_text:
             return
 
+        # Number of document chunks to retrieve for this question
+        search_results = choose_k(message_text)
+
+        # Canonical form shared by both caches (normalized once per message)
+        normalized_message = normalize(message_text)
+
+        # Serve repeated questions from the response cache (no model/search call)
+        cache_key: str | None = None
+        if self.response_cache is not None:
+            cache_key = _response_cache_key(normalized_message, search_results)
+            cached = await self.response_cache.get(cache_key)
+            if cached is not None:
+                for event in self._replay_answers(thread, cached, context):
+                    yield event
+                return
+
+        # Then look for a previously answered paraphrase of the question
+        query_embedding = None
+        if self.semantic_cache is not None:
+            try:
+                query_embedding = await self.semantic_cache.embed(normalized_message)
+            except OpenAIError:
+                logger.warning("Semantic cache lookup failed; answering without it", exc_info=True)
+            if query_embedding is not None:
+                cached = self.semantic_cache.lookup(query_embedding)
+                if cached is not None:
+                    for event in self._replay_answers(thread, cached, context):
+                        yield event
+                    return
+
         # Create agent context with thread and store access
         agent_context = AgentContext(
             thread=thread,
@@ -271,18 +373,63 @@ class KnowledgeAssistantServer(ChatKitServer[dict[str, Any]]):
         )
 
         # Run the agent with streaming
-        # Temperature is configured in config.py
+        # Temperature is configured in config.py. parallel_tool_calls=True only makes the
+        # Responses API default explicit; it does not change latency.
         result = Runner.run_streamed(
-            self.assistant,
+            with_search_results(self.assistant, search_results),
             message_text,
             context=agent_context,
-            run_config=RunConfig(model_settings=ModelSettings(temperature=ASSISTANT_TEMPERATURE)),
+            run_config=RunConfig(
+                model_settings=ModelSettings(
+                    temperature=ASSISTANT_TEMPERATURE,
+                    parallel_tool_calls=True,
+                )
+            ),
         )
 
-        # Stream response events to the client
+        # Stream response events to the client, keeping completed answers for the cache
+        answers: list[list[AssistantMessageContent]] = []
         async for event in stream_agent_response(agent_context, result):
+            if isinstance(event, ThreadItemDoneEvent) and isinstance(
+                event.item, AssistantMessageItem
+            ):
+                answers.append([part.model_copy(deep=True) for part in event.item.content])
             yield event
 
+        # Caching is a side effect: a failed write must not turn a delivered answer into an error
+        if self.response_cache is not None and cache_key is not None and answers:
+            try:
+                await self.response_cache.set(cache_key, answers)
+            except Exception:
+                logger.warning("Response cache write failed; answer not cached", exc_info=True)
+        if self.semantic_cache is not None and query_embedding is not None and answers:
+            try:
+                self.semantic_cache.insert(query_embedding, answers)
+            except Exception:
+                logger.warning("Semantic cache write failed; answer not cached", exc_info=True)
+
+    def _replay_answers(
+        self,
+        thread: ThreadMetadata,
+        answers: list[list[AssistantMessageContent]],
+        context: dict[str, Any],
+    ) -> Iterable[ThreadStreamEvent]:
+        """
+        Turn cached assistant answers into completed thread items.
+
+        Each cached answer becomes a new AssistantMessageItem with a fresh ID,
+        so the replayed message is stored in the thread like a normal response.
+        """
+        for content in answers:
+            yield ThreadItemDoneEvent(
+                item=AssistantMessageItem(
+                    id=self.store.generate_item_id("message", thread, context),
+                    thread_id=thread.id,
+                    created_at=datetime.now(),
+                    content=[part.model_copy(deep=True) for part in content],
+                )
+            )
+
     async def to_message_content(self, input: Attachment) -> ResponseInputContentParam:
         """
         Convert uploaded attachments to message content.
@@ -392,7 +539,7 @@ class KnowledgeAssistantServer(ChatKitServer[dict[str, Any]]):
 # ==============================================================================
 
 # Initialize the ChatKit server with our assistant agent
-knowledge_server = KnowledgeAssistantServer(agent=assistant_agent)
+knowledge_server = KnowledgeAssistantServer(agent=get_assistant_agent())
 
 # Create FastAPI app
 app = FastAPI(
@@ -404,7 +551,7 @@ app = FastAPI(
 # CORS middleware - CUSTOMIZE for production (restrict to your frontend domain)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=CORS_ORIGINS,
+    allow_origins=["*"] if CORS_ALLOW_ALL else sorted(CORS_ORIGINS),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -447,8 +594,12 @@ async def chatkit_endpoint(
     return JSONResponse(result)
 
 
+# DOCUMENTS never changes at runtime, so the listing is serialized once at startup
+_DOCUMENTS_LISTING = JSONResponse({"documents": as_dicts(DOCUMENTS)}).body
+
+
 @app.get("/knowledge/documents")
-async def list_documents() -> dict[str, Any]:
+async def list_documents() -> Response:
     """
     List all documents in the knowledge base.
 
@@ -458,7 +609,7 @@ async def list_documents() -> dict[str, Any]:
     Returns:
         {"documents": [{"id": "...", "filename": "...", "title": "...", ...}]}
     """
-    return {"documents": as_dicts(DOCUMENTS)}
+    return Response(content=_DOCUMENTS_LISTING, media_type="application/json")
 
 
 @app.get("/knowledge/documents/{document_id}/file")
@@ -564,7 +715,8 @@ async def health_check() -> dict[str, str]:
 
 if __name__ == "__main__":
     import uvicorn
-    from .config import SERVER_HOST, SERVER_PORT, LOG_LEVEL
+
+    from .config import LOG_LEVEL, SERVER_HOST, SERVER_PORT
 
     uvicorn.run(
         "app.main:app",
@@ -22,9 +22,13 @@ Example production implementation stubs are included in comments below.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List
+from itertools import dropwhile, islice
+from operator import attrgetter
+from typing import Any, Dict, Iterator
 
 from chatkit.store import NotFoundError, Store
 from chatkit.types import Attachment, Page, Thread, ThreadItem, ThreadMetadata
@@ -32,9 +36,17 @@ from chatkit.types import Attachment, Page, Thread, ThreadItem, ThreadMetadata
 
 @dataclass
 class _ThreadState:
-    """Internal representation of a thread with its metadata and items."""
+    """
+    Internal representation of a thread with its metadata and items.
+
+    Items are keyed by item ID (in insertion order) so lookups, updates and
+    deletes are O(1) instead of scanning the whole thread. `chronological`
+    stays True while insertion order matches created_at order (the normal case
+    for chat), which lets pagination walk the dict without sorting.
+    """
     thread: ThreadMetadata
-    items: List[ThreadItem]
+    items: OrderedDict[str, ThreadItem] = field(default_factory=OrderedDict)
+    chronological: bool = True
 
 
 class MemoryStore(Store[dict[str, Any]]):
@@ -46,6 +58,7 @@ class MemoryStore(Store[dict[str, Any]]):
 
     Attributes:
         _threads: Dictionary mapping thread_id -> _ThreadState
+        _thread_order: Sorted list of (created_at, thread_id) keys used for pagination
 
     Context Parameter:
         The 'context' parameter passed to all methods contains request-specific data.
@@ -58,6 +71,8 @@ class MemoryStore(Store[dict[str, Any]]):
 
     def __init__(self) -> None:
         self._threads: Dict[str, _ThreadState] = {}
+        # Kept sorted on every write so load_threads can binary-search the cursor
+        self._thread_order: list[tuple[datetime, str]] = []
         # Attachments intentionally unsupported; use a real store that enforces auth.
 
     @staticmethod
@@ -66,7 +81,8 @@ class MemoryStore(Store[dict[str, Any]]):
         Return thread metadata without any embedded items (openai-chatkit>=1.0).
 
         ChatKit can pass either ThreadMetadata or Thread objects. This ensures
-        we always work with ThreadMetadata (without items embedded).
+        we always work with ThreadMetadata (without items embedded). The result
+        is always a fresh instance, so it is safe to store.
         """
         has_items = isinstance(thread, Thread) or "items" in getattr(
             thread, "model_fields_set", set()
@@ -74,9 +90,26 @@ class MemoryStore(Store[dict[str, Any]]):
         if not has_items:
             return thread.model_copy(deep=True)
 
-        data = thread.model_dump()
-        data.pop("items", None)
-        return ThreadMetadata(**data).model_copy(deep=True)
+        # Python-mode dump keeps metadata values (datetimes, tuples, bytes) as-is
+        return ThreadMetadata.model_validate(thread.model_dump(exclude={"items"}))
+
+    @staticmethod
+    def _thread_sort_key(thread: ThreadMetadata) -> tuple[datetime, str]:
+        """Ordering key for threads: creation time, with the ID as tie-breaker."""
+        return (thread.created_at or datetime.min, thread.id)
+
+    def _add_thread_state(self, metadata: ThreadMetadata) -> _ThreadState:
+        """Register a new thread, insert it into the sorted thread index and return its state."""
+        state = self._threads[metadata.id] = _ThreadState(thread=metadata)
+        insort(self._thread_order, self._thread_sort_key(metadata))
+        return state
+
+    def _unindex_thread(self, thread: ThreadMetadata) -> None:
+        """Remove a thread's key from the sorted thread index."""
+        key = self._thread_sort_key(thread)
+        idx = bisect_left(self._thread_order, key)
+        if idx < len(self._thread_order) and self._thread_order[idx] == key:
+            del self._thread_order[idx]
 
     # ==========================================================================
     # THREAD METADATA OPERATIONS
@@ -107,7 +140,9 @@ class MemoryStore(Store[dict[str, Any]]):
         state = self._threads.get(thread_id)
         if not state:
             raise NotFoundError(f"Thread {thread_id} not found")
-        return self._coerce_thread_metadata(state.thread)
+        # Stored metadata never embeds items; a shallow copy keeps callers that
+        # update fields (e.g. title) from mutating the store before save_thread
+        return state.thread.model_copy()
 
     async def save_thread(self, thread: ThreadMetadata, context: dict[str, Any]) -> None:
         """
@@ -128,13 +163,15 @@ class MemoryStore(Store[dict[str, Any]]):
         """
         metadata = self._coerce_thread_metadata(thread)
         state = self._threads.get(thread.id)
-        if state:
-            state.thread = metadata
-        else:
-            self._threads[thread.id] = _ThreadState(
-                thread=metadata,
-                items=[],
-            )
+        if state is None:
+            self._add_thread_state(metadata)
+            return
+
+        # Re-index only when the sort key actually changes
+        if self._thread_sort_key(state.thread) != self._thread_sort_key(metadata):
+            self._unindex_thread(state.thread)
+            insort(self._thread_order, self._thread_sort_key(metadata))
+        state.thread = metadata
 
     async def load_threads(
         self,
@@ -167,19 +204,23 @@ class MemoryStore(Store[dict[str, Any]]):
             #     query = query.filter(Thread.created_at > after_thread.created_at)
             # threads = await query.limit(limit + 1).all()
         """
-        threads = sorted(
-            (self._coerce_thread_metadata(state.thread) for state in self._threads.values()),
-            key=lambda t: t.created_at or datetime.min,
-            reverse=(order == "desc"),
+        # Locate the cursor in the sorted index with a binary search (unknown cursors
+        # restart from the beginning, like an initial request)
+        cursor_state = self._threads.get(after) if after else None
+        cursor = (
+            bisect_left(self._thread_order, self._thread_sort_key(cursor_state.thread))
+            if cursor_state
+            else None
         )
 
-        if after:
-            index_map = {thread.id: idx for idx, thread in enumerate(threads)}
-            start = index_map.get(after, -1) + 1
+        if order == "desc":
+            end = len(self._thread_order) if cursor is None else cursor
+            keys = self._thread_order[max(end - limit - 1, 0) : end][::-1]
         else:
-            start = 0
+            start = 0 if cursor is None else cursor + 1
+            keys = self._thread_order[start : start + limit + 1]
 
-        slice_threads = threads[start : start + limit + 1]
+        slice_threads = [self._threads[thread_id].thread for _, thread_id in keys]
         has_more = len(slice_threads) > limit
         slice_threads = slice_threads[:limit]
         next_after = slice_threads[-1].id if has_more and slice_threads else None
@@ -203,26 +244,48 @@ class MemoryStore(Store[dict[str, Any]]):
             # await db.query(Thread).filter_by(id=thread_id, user_id=user_id).delete()
             # await db.commit()
         """
-        self._threads.pop(thread_id, None)
+        state = self._threads.pop(thread_id, None)
+        if state is not None:
+            self._unindex_thread(state.thread)
 
     # ==========================================================================
     # THREAD ITEMS (MESSAGES) OPERATIONS
     # ==========================================================================
 
-    def _items(self, thread_id: str) -> List[ThreadItem]:
+    def _thread_state(self, thread_id: str) -> _ThreadState:
         """
-        Get the list of items for a thread, creating the thread if it doesn't exist.
+        Get the state for a thread, creating the thread if it doesn't exist.
 
         This is a helper method for internal use.
         """
+        # Hit path is a single dict lookup; the placeholder metadata (and its
+        # timestamp) is only built when the thread is actually missing
         state = self._threads.get(thread_id)
-        if state is None:
-            state = _ThreadState(
-                thread=ThreadMetadata(id=thread_id, created_at=datetime.utcnow()),
-                items=[],
-            )
-            self._threads[thread_id] = state
-        return state.items
+        if state is not None:
+            return state
+        return self._add_thread_state(
+            # Naive local time, matching the timestamps ChatKit assigns to threads and items
+            ThreadMetadata(id=thread_id, created_at=datetime.now())
+        )
+
+    def _items(self, thread_id: str) -> OrderedDict[str, ThreadItem]:
+        """Get the items (keyed by item ID) for a thread, creating the thread if needed."""
+        return self._thread_state(thread_id).items
+
+    def _put_item(self, thread_id: str, item: ThreadItem) -> None:
+        """
+        Insert or replace an item, tracking whether the thread is still chronological.
+
+        Existing items keep their position; new items are appended.
+        """
+        state = self._thread_state(thread_id)
+        existing = state.items.get(item.id)
+        if existing is not None:
+            if existing.created_at != item.created_at:
+                state.chronological = False
+        elif state.items and item.created_at < next(reversed(state.items.values())).created_at:
+            state.chronological = False
+        state.items[item.id] = item
 
     async def load_thread_items(
         self,
@@ -249,19 +312,31 @@ class MemoryStore(Store[dict[str, Any]]):
             # Verify user has access to this thread
             # Query database with proper indexing for performance
         """
-        items = [item.model_copy(deep=True) for item in self._items(thread_id)]
-        items.sort(
-            key=lambda item: getattr(item, "created_at", datetime.utcnow()),
-            reverse=(order == "desc"),
-        )
-
-        if after:
-            index_map = {item.id: idx for idx, item in enumerate(items)}
-            start = index_map.get(after, -1) + 1
+        state = self._thread_state(thread_id)
+
+        # Items are copied on write and treated as immutable, so reads return them directly.
+        # Chronological threads are already in created_at order: walk them lazily and stop
+        # after one page instead of materializing and sorting the whole thread.
+        values: Iterator[ThreadItem]
+        if state.chronological:
+            values = (
+                reversed(state.items.values()) if order == "desc" else iter(state.items.values())
+            )
         else:
-            start = 0
+            values = iter(
+                sorted(
+                    state.items.values(),
+                    key=attrgetter("created_at"),
+                    reverse=(order == "desc"),
+                )
+            )
+
+        # Skip past the cursor (unknown cursors start from the beginning)
+        if after and after in state.items:
+            values = dropwhile(lambda item: item.id != after, values)
+            next(values, None)
 
-        slice_items = items[start : start + limit + 1]
+        slice_items = list(islice(values, limit + 1))
         has_more = len(slice_items) > limit
         slice_items = slice_items[:limit]
         next_after = slice_items[-1].id if has_more and slice_items else None
@@ -282,7 +357,7 @@ class MemoryStore(Store[dict[str, Any]]):
             # await db.add(ThreadItem(**item.model_dump(), thread_id=thread_id))
             # await db.commit()
         """
-        self._items(thread_id).append(item.model_copy(deep=True))
+        self._put_item(thread_id, item.model_copy(deep=True))
 
     async def save_item(self, thread_id: str, item: ThreadItem, context: dict[str, Any]) -> None:
         """
@@ -295,12 +370,7 @@ class MemoryStore(Store[dict[str, Any]]):
             item: ThreadItem to save
             context: Request context
         """
-        items = self._items(thread_id)
-        for idx, existing in enumerate(items):
-            if existing.id == item.id:
-                items[idx] = item.model_copy(deep=True)
-                return
-        items.append(item.model_copy(deep=True))
+        self._put_item(thread_id, item.model_copy(deep=True))
 
     async def load_item(self, thread_id: str, item_id: str, context: dict[str, Any]) -> ThreadItem:
         """
@@ -317,10 +387,10 @@ class MemoryStore(Store[dict[str, Any]]):
         Raises:
             NotFoundError: If item doesn't exist
         """
-        for item in self._items(thread_id):
-            if item.id == item_id:
-                return item.model_copy(deep=True)
-        raise NotFoundError(f"Item {item_id} not found")
+        item = self._items(thread_id).get(item_id)
+        if item is None:
+            raise NotFoundError(f"Item {item_id} not found")
+        return item
 
     async def delete_thread_item(
         self, thread_id: str, item_id: str, context: dict[str, Any]
@@ -333,8 +403,7 @@ class MemoryStore(Store[dict[str, Any]]):
             item_id: ID of the item to delete
             context: Request context
         """
-        items = self._items(thread_id)
-        self._threads[thread_id].items = [item for item in items if item.id != item_id]
+        self._items(thread_id).pop(item_id, None)
 
     # ==========================================================================
     # FILE ATTACHMENT OPERATIONS
@@ -0,0 +1,108 @@
+"""
+Assistant Response Cache
+
+This module provides a small in-memory cache for assistant responses.
+When a user asks exactly the same question twice, the cached answer (including
+its citations) is replayed instead of running the agent and the File Search
+tool again.
+
+Cache keys are a SHA-256 hash of the model, the instructions, the normalized
+user message, the tool configuration, and the model settings, so any change
+to the assistant setup automatically invalidates previous entries.
+
+CUSTOMIZATION:
+- Tune CACHE_MAX_SIZE and CACHE_TTL_SECONDS in config.py
+- Set CACHE_ENABLED=false to always call the model
+- For multi-instance deployments, replace LLMCache with a shared cache (e.g. Redis)
+  exposing the same async get()/set() interface
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class LLMCache:
+    """
+    Bounded LRU cache with per-entry time-to-live.
+
+    Entries are kept in insertion/access order. Reading an entry moves it to the
+    end of the queue; when the cache grows past max_size the least recently used
+    entry is evicted. Expired entries are dropped lazily on read.
+
+    The get()/set() methods are async so a network-backed cache can be swapped
+    in without changing callers.
+
+    Attributes:
+        max_size: Maximum number of responses to keep
+        ttl_seconds: How long a cached response stays valid
+    """
+
+    def __init__(self, max_size: int = 1000, ttl_seconds: float = 3600.0) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    @staticmethod
+    def cache_key(
+        model: str,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]],
+        settings: dict[str, Any] | None = None,
+    ) -> str:
+        """
+        Build a stable cache key for a model request.
+
+        Args:
+            model: Model name
+            messages: Chat messages sent to the model (role/content dicts)
+            tools: JSON-serializable description of the tools available
+            settings: Model settings that affect the output (e.g. temperature)
+
+        Returns:
+            Hex-encoded SHA-256 digest of the request
+        """
+        payload = json.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "tools": tools,
+                "settings": settings or {},
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Any | None:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries if full."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+__all__ = ["LLMCache"]
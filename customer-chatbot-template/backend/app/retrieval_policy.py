@@ -0,0 +1,57 @@
+"""
+Retrieval Policy
+
+Decides how many document chunks the File Search tool retrieves for a question.
+Every extra chunk costs vector store latency and input tokens, so short factual
+questions get a small K while long, multi-part questions get more context.
+
+CUSTOMIZATION:
+- MAX_SEARCH_RESULTS / MAX_SEARCH_RESULTS_LIMIT in config.py set the default and ceiling
+  (config.py guarantees 1 <= default <= ceiling <= 50)
+- ADAPTIVE_SEARCH_RESULTS=false always uses MAX_SEARCH_RESULTS
+- Adjust SHORT_QUERY_WORDS / LONG_QUERY_WORDS for your users' question style
+- Adjust SHORT_QUERY_RESULTS / LONG_QUERY_RESULTS for how much context each gets
+"""
+from __future__ import annotations
+
+from .config import (
+    ADAPTIVE_SEARCH_RESULTS,
+    MAX_SEARCH_RESULTS_DEFAULT,
+    MAX_SEARCH_RESULTS_LIMIT,
+)
+
+# Questions with fewer words than this are treated as short factual lookups
+SHORT_QUERY_WORDS = 8
+
+# Questions with more words than this are treated as long/complex
+LONG_QUERY_WORDS = 30
+
+# Chunks retrieved for short questions (never more than the configured default)
+SHORT_QUERY_RESULTS = 3
+
+# Chunks retrieved for long questions (never more than MAX_SEARCH_RESULTS_LIMIT)
+LONG_QUERY_RESULTS = 10
+
+
+def choose_k(query: str) -> int:
+    """
+    Pick the number of chunks to retrieve for a question.
+
+    Args:
+        query: The user's question
+
+    Returns:
+        Number of chunks to retrieve (always at least 1)
+    """
+    if not ADAPTIVE_SEARCH_RESULTS:
+        return MAX_SEARCH_RESULTS_DEFAULT
+
+    word_count = len(query.split())
+    if word_count < SHORT_QUERY_WORDS:
+        return min(SHORT_QUERY_RESULTS, MAX_SEARCH_RESULTS_DEFAULT)
+    if word_count > LONG_QUERY_WORDS:
+        return max(min(LONG_QUERY_RESULTS, MAX_SEARCH_RESULTS_LIMIT), MAX_SEARCH_RESULTS_DEFAULT)
+    return MAX_SEARCH_RESULTS_DEFAULT
+
+
+__all__ = ["choose_k"]
@@ -0,0 +1,139 @@
+"""
+Semantic Response Cache
+
+This module complements the exact-match response cache with an embedding
+similarity lookup. Paraphrased questions ("reset my password" vs "change my
+password") produce nearly identical embeddings, so a previous answer can be
+replayed without running the agent and the File Search tool again.
+
+How it works:
+- The user message is embedded (text-embedding-3-small by default)
+- Embeddings are L2-normalized once at insert and stored in a fixed-size
+  float32 matrix, so a lookup is a single matrix-vector product (cosine similarity)
+- The best match is returned when its similarity reaches the threshold
+
+CUSTOMIZATION:
+- SEMANTIC_CACHE_THRESHOLD in config.py controls how similar questions must be.
+  Lower values increase hit rate but risk answering a different question.
+- SEMANTIC_CACHE_TTL controls how long cached answers are reused
+- SEMANTIC_CACHE_MAX_SIZE bounds memory (one float32 vector per cached answer)
+- The cache is opt-in: set SEMANTIC_CACHE_ENABLED=true to use it
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Awaitable, Callable
+
+import numpy as np
+from openai import AsyncOpenAI
+
+Embedder = Callable[[str], Awaitable[np.ndarray]]
+
+
+class OpenAIEmbedder:
+    """
+    Async embedder backed by the OpenAI embeddings API.
+
+    Args:
+        model: Embedding model name
+        client: Optional AsyncOpenAI client (a default client is created lazily)
+    """
+
+    def __init__(self, model: str = "text-embedding-3-small", client: AsyncOpenAI | None = None):
+        self.model = model
+        self._client = client
+
+    async def __call__(self, text: str) -> np.ndarray:
+        if self._client is None:
+            self._client = AsyncOpenAI()
+        response = await self._client.embeddings.create(model=self.model, input=text)
+        return np.asarray(response.data[0].embedding, dtype=np.float32)
+
+
+class SemanticCache:
+    """
+    Bounded in-memory cache keyed by embedding similarity.
+
+    Entries live in a preallocated (max_size, D) matrix used as a ring buffer:
+    once full, the oldest entry is overwritten. Expired entries are skipped at
+    lookup time.
+
+    Attributes:
+        embedder: Async callable turning text into an embedding vector
+        threshold: Minimum cosine similarity for a cache hit (0.0-1.0)
+        max_size: Maximum number of cached responses
+        ttl: How long a cached response stays valid, in seconds
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        threshold: float = 0.92,
+        max_size: int = 2000,
+        ttl: float = 600.0,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        self.embedder = embedder
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl = ttl
+        self._vectors: np.ndarray | None = None
+        self._inserted_at = np.zeros(max_size, dtype=np.float64)
+        self._responses: list[Any] = [None] * max_size
+        self._count = 0
+        self._next = 0
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed text and return an L2-normalized float32 vector."""
+        vector = np.asarray(await self.embedder(text), dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def lookup(self, query_embedding: np.ndarray) -> Any | None:
+        """
+        Return the cached response most similar to query_embedding.
+
+        Args:
+            query_embedding: Normalized embedding produced by embed()
+
+        Returns:
+            The cached response if the best similarity reaches the threshold, else None
+        """
+        if self._vectors is None or self._count == 0:
+            return None
+
+        scores = self._vectors[: self._count] @ query_embedding
+        expired = self._inserted_at[: self._count] <= time.monotonic() - self.ttl
+        scores[expired] = -np.inf
+
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+        return self._responses[best]
+
+    def insert(self, query_embedding: np.ndarray, response: Any) -> None:
+        """Cache response under query_embedding, overwriting the oldest entry when full."""
+        if self._vectors is None:
+            self._vectors = np.zeros((self.max_size, query_embedding.shape[0]), dtype=np.float32)
+
+        slot = self._next
+        self._vectors[slot] = query_embedding
+        self._inserted_at[slot] = time.monotonic()
+        self._responses[slot] = response
+        self._next = (slot + 1) % self.max_size
+        self._count = min(self._count + 1, self.max_size)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._vectors = None
+        self._inserted_at.fill(0.0)
+        self._responses = [None] * self.max_size
+        self._count = 0
+        self._next = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+
+__all__ = ["Embedder", "OpenAIEmbedder", "SemanticCache"]
@@ -19,12 +19,18 @@ Options:
     --assistant-name    - Name for the vector store (default: from config or prompt)
     --update-only       - Only regenerate documents.py from existing vector store
     --vector-store-id   - Use existing vector store ID (skip creation)
+    --upload-concurrency - Number of documents uploaded in parallel (default: 8)
 """
 
 import argparse
+import asyncio
+import functools
+import importlib.util
 import os
+import re
 import sys
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from typing import List
 
@@ -32,7 +38,7 @@ from typing import List
 sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, OpenAI
 except ImportError:
     print("Error: openai package not installed")
     print("Install with: pip install openai")
@@ -48,6 +54,13 @@ class DocumentInfo:
     description: str
 
 
+# Document formats accepted by collect_documents (a tuple, so str.endswith can take it)
+SUPPORTED_EXTENSIONS = (".doc", ".docx", ".html", ".md", ".pdf", ".txt")
+
+# Runs of characters that are not alphanumeric (same set as `not str.isalnum()`)
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+
+
 def slugify(text: str) -> str:
     """Convert text to a valid Python identifier."""
     # Remove extension
@@ -57,14 +70,12 @@ def slugify(text: str) -> str:
         parts = text.split("_", 1)
         if len(parts) > 1:
             text = parts[1]
-    # Replace non-alphanumeric with underscore
-    slug = "".join(c if c.isalnum() else "_" for c in text)
-    # Remove consecutive underscores
-    while "__" in slug:
-        slug = slug.replace("__", "_")
+    # Replace each run of non-alphanumeric characters with a single underscore
+    slug = _NON_ALNUM_RE.sub("_", text)
     return slug.strip("_").lower()
 
 
+@functools.cache
 def generate_title(filename: str) -> str:
     """Generate a human-readable title from filename."""
     stem = Path(filename).stem
@@ -78,6 +89,17 @@ def generate_title(filename: str) -> str:
     return title
 
 
+def document_info(doc_path: Path, file_id: str = "") -> DocumentInfo:
+    """Build the DocumentInfo for a document, deriving its title once."""
+    title = generate_title(doc_path.name)
+    return DocumentInfo(
+        file_id=file_id,
+        filename=doc_path.name,
+        title=title,
+        description=f"Knowledge base document: {title}",
+    )
+
+
 def collect_documents(data_dir: Path) -> List[Path]:
     """
     Collect document files from the data directory.
@@ -89,43 +111,60 @@ def collect_documents(data_dir: Path) -> List[Path]:
         print(f"Create it and add your documents: mkdir -p {data_dir}")
         sys.exit(1)
 
-    supported_extensions = {".pdf", ".html", ".txt", ".md", ".docx", ".doc"}
-    documents = [
-        f for f in sorted(data_dir.iterdir())
-        if f.is_file() and f.suffix.lower() in supported_extensions
-    ]
+    # os.scandir reuses the file type from the directory listing, avoiding a stat per entry
+    with os.scandir(data_dir) as entries:
+        documents = sorted(
+            (
+                Path(entry.path)
+                for entry in entries
+                if entry.is_file()
+                and not entry.name.startswith(".")
+                and entry.name.lower().endswith(SUPPORTED_EXTENSIONS)
+            ),
+            key=lambda path: path.name,
+        )
 
     if not documents:
         print(f"Error: No documents found in {data_dir}")
-        print(f"Supported formats: {', '.join(supported_extensions)}")
+        print(f"Supported formats: {', '.join(SUPPORTED_EXTENSIONS)}")
         sys.exit(1)
 
     return documents
 
 
-def upload_documents(client: OpenAI, documents: List[Path]) -> List[DocumentInfo]:
-    """Upload documents to OpenAI and return file information."""
+async def upload_documents(
+    client: AsyncOpenAI, documents: List[Path], concurrency: int = 8
+) -> List[DocumentInfo]:
+    """
+    Upload documents to OpenAI concurrently and return file information.
+
+    Uploads are network-bound, so up to `concurrency` files are in flight at
+    once. File contents are read in a worker thread so disk I/O never blocks
+    the other uploads. Results keep the order of `documents`; failed uploads
+    are skipped.
+    """
     print(f"\n📤 Uploading {len(documents)} documents to OpenAI...")
 
-    uploaded = []
-    for doc_path in documents:
-        print(f"  Uploading {doc_path.name}...", end=" ", flush=True)
-        try:
-            with open(doc_path, "rb") as f:
-                file_obj = client.files.create(file=f, purpose="assistants")
-
-            uploaded.append(
-                DocumentInfo(
-                    file_id=file_obj.id,
-                    filename=doc_path.name,
-                    title=generate_title(doc_path.name),
-                    description=f"Knowledge base document: {generate_title(doc_path.name)}",
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _upload_one(doc_path: Path) -> DocumentInfo | None:
+        async with semaphore:
+            try:
+                content = await asyncio.to_thread(doc_path.read_bytes)
+                file_obj = await client.files.create(
+                    file=(doc_path.name, content),
+                    purpose="assistants",
                 )
-            )
-            print(f"✓ ({file_obj.id})")
-        except Exception as e:
-            print(f"✗ Failed: {e}")
-            # Continue with other files
+            except Exception as e:
+                print(f"  ✗ {doc_path.name} failed: {e}")
+                # Continue with other files
+                return None
+
+        print(f"  ✓ {doc_path.name} ({file_obj.id})")
+        return document_info(doc_path, file_obj.id)
+
+    results = await asyncio.gather(*(_upload_one(doc_path) for doc_path in documents))
+    uploaded = [doc for doc in results if doc is not None]
 
     if not uploaded:
         print("Error: No documents uploaded successfully")
@@ -134,6 +173,14 @@ def upload_documents(client: OpenAI, documents: List[Path]) -> List[DocumentInfo
     return uploaded
 
 
+async def upload_all(
+    api_key: str, documents: List[Path], concurrency: int = 8
+) -> List[DocumentInfo]:
+    """Upload documents with a client that is closed (connection pool included) afterwards."""
+    async with AsyncOpenAI(api_key=api_key) as client:
+        return await upload_documents(client, documents, concurrency=concurrency)
+
+
 def create_vector_store(
     client: OpenAI, documents: List[DocumentInfo], store_name: str
 ) -> str:
@@ -153,48 +200,55 @@ def create_vector_store(
         sys.exit(1)
 
 
-def generate_documents_py(documents: List[DocumentInfo], output_path: Path) -> None:
-    """Generate documents.py file with document metadata."""
-    print(f"\n📝 Generating {output_path}...")
-
-    # Build document entries
-    doc_entries = []
-    for doc in documents:
-        slug = slugify(doc.filename)
-        doc_entries.append(
-            f'''    DocumentMetadata(
-        id="{slug}",
-        filename="{doc.filename}",
-        title="{doc.title}",
-        description="{doc.description}",
-    ),'''
-        )
-
-    documents_tuple = "\n".join(doc_entries)
+# ==============================================================================
+# documents.py TEMPLATE
+# ==============================================================================
+# generate_documents_py writes HEADER, one ENTRY per document, then FOOTER.
+# Values are emitted with repr() (!r), which always yields a valid Python
+# literal (escaped strings, and None for a missing description).
 
-    content = f'''"""
+_DOCUMENTS_PY_HEADER = '''"""
 Document Metadata Registry
 
 This file was AUTO-GENERATED by scripts/setup-vector-store.py
-Last generated: {Path(__file__).stat().st_mtime}
+Last generated: {generated_at}
 
 Do not edit manually - run the setup script again to regenerate.
 """
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+import hashlib
+import pickle
+import re
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import asdict, astuple, dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable
+from types import ModuleType
 
+_fuzzy_process: ModuleType | None
+try:
+    from rapidfuzz import process as _fuzzy_process
+    from rapidfuzz.distance import Levenshtein as _Levenshtein
+except ImportError:  # Optional: pip install rapidfuzz enables typo-tolerant lookups
+    _fuzzy_process = None
+
+
+# Runs of characters that are not alphanumeric (same set as `not str.isalnum()`)
+_NON_ALNUM_RE = re.compile(r"[\\W_]+")
 
-def _normalise(value: str) -> str:
+
+@lru_cache(maxsize=4096)
+def normalise_text(value: str) -> str:
     """Normalize string for matching (lowercase, trimmed)."""
     return value.strip().lower()
 
 
-def _slugify(value: str) -> str:
+@lru_cache(maxsize=4096)
+def slugify_text(value: str) -> str:
     """Convert string to alphanumeric-only slug for fuzzy matching."""
-    return "".join(ch for ch in value.lower() if ch.isalnum())
+    return _NON_ALNUM_RE.sub("", value.lower())
 
 
 @dataclass(frozen=True, slots=True)
@@ -213,6 +267,11 @@ class DocumentMetadata:
     title: str
     description: str | None = None
 
+    def __post_init__(self) -> None:
+        # Intern identifying strings so repeated values share a single object
+        for name in ("id", "filename", "title"):
+            object.__setattr__(self, name, sys.intern(getattr(self, name)))
+
     @property
     def stem(self) -> str:
         """Filename without extension."""
@@ -220,40 +279,134 @@ class DocumentMetadata:
 
 
 # ==============================================================================
-# DOCUMENT REGISTRY - {len(documents)} documents
+# DOCUMENT REGISTRY - {document_count} documents
 # ==============================================================================
 
 DOCUMENTS: tuple[DocumentMetadata, ...] = (
-{documents_tuple}
-)
+'''
+
+_DOCUMENTS_PY_ENTRY = """    DocumentMetadata(
+        id={id!r},
+        filename={filename!r},
+        title={title!r},
+        description={description!r},
+    ),
+"""
+
+_DOCUMENTS_PY_FOOTER = ''')
 
 # ==============================================================================
-# DOCUMENT LOOKUP INDICES
+# DOCUMENT LOOKUP INDEX
 # ==============================================================================
+# One dictionary for every key kind; prefixes keep kinds from colliding:
+#   "id:<id>", "fn:<filename>", "st:<stem>", "sl:<slug>"
+
+_ID_KEY = "id:"
+_FILENAME_KEY = "fn:"
+_STEM_KEY = "st:"
+_SLUG_KEY = "sl:"
+
+# Prebuilt index written by scripts/setup-vector-store.py next to this file
+_INDEX_CACHE_PATH = Path(__file__).with_suffix(".pkl")
+# Bump when the layout of the pickled payload changes
+_INDEX_CACHE_FORMAT = 1
+
+
+def _build_index(documents: tuple[DocumentMetadata, ...]) -> dict[str, DocumentMetadata]:
+    """Build the lookup index from scratch."""
+    index: dict[str, DocumentMetadata] = {}
+    for document in documents:
+        stem = document.stem  # derived property: compute once per document
+        index[_ID_KEY + document.id] = document
+        index[_FILENAME_KEY + normalise_text(document.filename)] = document
+        index[_STEM_KEY + normalise_text(stem)] = document
+        # Fuzzy matching keys using slugified versions of all text fields
+        # (duplicates are harmless: setdefault keeps the first match)
+        for candidate in (
+            document.id,
+            document.filename,
+            stem,
+            document.title,
+            document.description,
+        ):
+            if candidate:
+                index.setdefault(_SLUG_KEY + slugify_text(candidate), document)
+    return index
+
+
+def _source_digest() -> str:
+    """SHA-256 of this source file; any edit (e.g. to the key builders) invalidates the cache."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def _load_index(documents: tuple[DocumentMetadata, ...]) -> dict[str, DocumentMetadata] | None:
+    """Load the prebuilt index, or None if it is missing, stale or malformed."""
+    try:
+        with _INDEX_CACHE_PATH.open("rb") as fh:
+            cached = pickle.load(fh)
+        if (
+            cached["format"] != _INDEX_CACHE_FORMAT
+            or cached["source"] != _source_digest()
+            or cached["documents"] != [astuple(document) for document in documents]
+        ):
+            return None
+        index: dict[str, DocumentMetadata] = {}
+        for key, position in cached["index"].items():
+            if not (isinstance(key, str) and 0 <= position < len(documents)):
+                return None
+            index[key] = documents[position]
+        return index
+    except Exception:  # Unreadable or unexpected payload: rebuild from source instead
+        return None
+
+
+def _write_index_cache() -> None:
+    """Pickle DOCUMENTS_INDEX so later imports can skip rebuilding it."""
+    positions = {id(document): position for position, document in enumerate(DOCUMENTS)}
+    payload = {
+        "format": _INDEX_CACHE_FORMAT,
+        "source": _source_digest(),
+        "documents": [astuple(document) for document in DOCUMENTS],
+        "index": {key: positions[id(document)] for key, document in DOCUMENTS_INDEX.items()},
+    }
+    with _INDEX_CACHE_PATH.open("wb") as fh:
+        pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+DOCUMENTS_INDEX: dict[str, DocumentMetadata] = _load_index(DOCUMENTS) or _build_index(DOCUMENTS)
 
-DOCUMENTS_BY_ID: dict[str, DocumentMetadata] = {{
-    doc.id: doc for doc in DOCUMENTS
-}}
 
-DOCUMENTS_BY_FILENAME: dict[str, DocumentMetadata] = {{
-    _normalise(doc.filename): doc for doc in DOCUMENTS
-}}
+class _IndexView(Mapping[str, DocumentMetadata]):
+    """Read-only view of DOCUMENTS_INDEX restricted to one key prefix."""
 
-DOCUMENTS_BY_STEM: dict[str, DocumentMetadata] = {{
-    _normalise(doc.stem): doc for doc in DOCUMENTS
-}}
+    __slots__ = ("_prefix",)
 
-DOCUMENTS_BY_SLUG: dict[str, DocumentMetadata] = {{}}
-for document in DOCUMENTS:
-    for candidate in {{
-        document.id,
-        document.filename,
-        document.stem,
-        document.title,
-        document.description or "",
-    }}:
-        if candidate:
-            DOCUMENTS_BY_SLUG.setdefault(_slugify(candidate), document)
+    def __init__(self, prefix: str) -> None:
+        self._prefix = prefix
+
+    def __getitem__(self, key: str) -> DocumentMetadata:
+        return DOCUMENTS_INDEX[self._prefix + key]
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._prefix + key in DOCUMENTS_INDEX
+
+    def __iter__(self) -> Iterator[str]:
+        size = len(self._prefix)
+        return (key[size:] for key in DOCUMENTS_INDEX if key.startswith(self._prefix))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+DOCUMENTS_BY_ID: Mapping[str, DocumentMetadata] = _IndexView(_ID_KEY)
+DOCUMENTS_BY_FILENAME: Mapping[str, DocumentMetadata] = _IndexView(_FILENAME_KEY)
+DOCUMENTS_BY_STEM: Mapping[str, DocumentMetadata] = _IndexView(_STEM_KEY)
+DOCUMENTS_BY_SLUG: Mapping[str, DocumentMetadata] = _IndexView(_SLUG_KEY)
+
+# Candidate slugs for the fuzzy fallback in find_document()
+_FUZZY_CHOICES: tuple[str, ...] = tuple(DOCUMENTS_BY_SLUG)
+# Slugs shorter than this are too ambiguous to match approximately
+_FUZZY_MIN_LENGTH = 4
 
 
 def as_dicts(documents: Iterable[DocumentMetadata]) -> list[dict[str, str | None]]:
@@ -261,19 +414,42 @@ def as_dicts(documents: Iterable[DocumentMetadata]) -> list[dict[str, str | None
     return [asdict(document) for document in documents]
 
 
+def _fuzzy_find(slug: str) -> DocumentMetadata | None:
+    """Closest slug within a small edit distance (requires rapidfuzz)."""
+    if _fuzzy_process is None or len(slug) < _FUZZY_MIN_LENGTH:
+        return None
+    match = _fuzzy_process.extractOne(
+        slug,
+        _FUZZY_CHOICES,
+        scorer=_Levenshtein.distance,
+        score_cutoff=max(len(slug) // 4, 2),
+    )
+    if match is None:
+        return None
+    return DOCUMENTS_INDEX[_SLUG_KEY + match[0]]
+
+
 def find_document(query: str) -> DocumentMetadata | None:
     """Find a document by ID, filename, or fuzzy match."""
-    if query in DOCUMENTS_BY_ID:
-        return DOCUMENTS_BY_ID[query]
-    normalized = _normalise(query)
-    if normalized in DOCUMENTS_BY_FILENAME:
-        return DOCUMENTS_BY_FILENAME[normalized]
-    if normalized in DOCUMENTS_BY_STEM:
-        return DOCUMENTS_BY_STEM[normalized]
-    slug = _slugify(query)
-    if slug in DOCUMENTS_BY_SLUG:
-        return DOCUMENTS_BY_SLUG[slug]
-    return None
+    document = DOCUMENTS_INDEX.get(_ID_KEY + query) or DOCUMENTS_INDEX.get(
+        _FILENAME_KEY + query
+    )
+    if document is not None:
+        return document
+
+    normalized = normalise_text(query)
+    document = DOCUMENTS_INDEX.get(_FILENAME_KEY + normalized) or DOCUMENTS_INDEX.get(
+        _STEM_KEY + normalized
+    )
+    if document is not None:
+        return document
+
+    slug = slugify_text(query)
+    document = DOCUMENTS_INDEX.get(_SLUG_KEY + slug)
+    if document is not None:
+        return document
+
+    return _fuzzy_find(slug)
 
 
 __all__ = [
@@ -282,37 +458,80 @@ __all__ = [
     "DOCUMENTS_BY_ID",
     "DOCUMENTS_BY_STEM",
     "DOCUMENTS_BY_SLUG",
+    "DOCUMENTS_INDEX",
     "DocumentMetadata",
     "as_dicts",
     "find_document",
+    "normalise_text",
+    "slugify_text",
 ]
 '''
 
-    output_path.write_text(content)
+
+def generate_documents_py(documents: List[DocumentInfo], output_path: Path) -> None:
+    """Generate documents.py file with document metadata."""
+    print(f"\n📝 Generating {output_path}...")
+
+    # Stream entries straight to the file instead of building one large string
+    with open(output_path, "w", encoding="utf-8") as fh:
+        fh.write(
+            _DOCUMENTS_PY_HEADER.format(
+                generated_at=datetime.now().isoformat(timespec="seconds"),
+                document_count=len(documents),
+            )
+        )
+        for doc in documents:
+            fh.write(
+                _DOCUMENTS_PY_ENTRY.format(
+                    id=slugify(doc.filename),
+                    filename=doc.filename,
+                    title=doc.title,
+                    description=doc.description,
+                )
+            )
+        fh.write(_DOCUMENTS_PY_FOOTER)
+
+    write_documents_index(output_path)
     print(f"✓ Generated with {len(documents)} documents")
 
 
+def write_documents_index(documents_py_path: Path) -> None:
+    """
+    Write the prebuilt lookup index (documents.pkl) next to a generated documents.py.
+
+    The generated module is imported once here so the index is built by the
+    exact code the backend runs; the backend then loads the pickle at startup
+    instead of re-normalizing every document.
+    """
+    spec = importlib.util.spec_from_file_location("_generated_documents", documents_py_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        del sys.modules[spec.name]
+    module._write_index_cache()
+
+
+# The VECTOR_STORE_ID entry of a .env file
+_VECTOR_STORE_ID_RE = re.compile(r"^VECTOR_STORE_ID=.*$", re.MULTILINE)
+
+
 def update_env_file(env_path: Path, vector_store_id: str) -> None:
     """Update .env file with VECTOR_STORE_ID."""
     print(f"\n⚙️  Updating {env_path}...")
 
-    if env_path.exists():
-        # Update existing file
-        lines = env_path.read_text().splitlines()
-        updated = False
-        for i, line in enumerate(lines):
-            if line.startswith("VECTOR_STORE_ID="):
-                lines[i] = f"VECTOR_STORE_ID={vector_store_id}"
-                updated = True
-                break
+    line = f"VECTOR_STORE_ID={vector_store_id}"
+    text = env_path.read_text() if env_path.exists() else ""
 
-        if not updated:
-            lines.append(f"VECTOR_STORE_ID={vector_store_id}")
+    # Replace the existing entry in one regex pass, or append one if missing
+    text, replaced = _VECTOR_STORE_ID_RE.subn(lambda _: line, text, count=1)
+    if not replaced:
+        if text and not text.endswith("\n"):
+            text += "\n"
+        text += line + "\n"
 
-        env_path.write_text("\n".join(lines) + "\n")
-    else:
-        # Create new file from template
-        env_path.write_text(f"VECTOR_STORE_ID={vector_store_id}\n")
+    env_path.write_text(text)
 
     print(f"✓ Updated VECTOR_STORE_ID={vector_store_id}")
 
@@ -340,6 +559,12 @@ def main():
         action="store_true",
         help="Only regenerate documents.py from existing files (no upload)",
     )
+    parser.add_argument(
+        "--upload-concurrency",
+        type=int,
+        default=8,
+        help="Number of documents uploaded in parallel",
+    )
     args = parser.parse_args()
 
     # Paths
@@ -367,16 +592,8 @@ def main():
         print(f"   - {doc.name}")
 
     if args.update_only:
-        # Just regenerate documents.py
-        documents = [
-            DocumentInfo(
-                file_id="",  # Not needed for update-only
-                filename=doc.name,
-                title=generate_title(doc.name),
-                description=f"Knowledge base document: {generate_title(doc.name)}",
-            )
-            for doc in document_paths
-        ]
+        # Just regenerate documents.py (file IDs are not needed)
+        documents = [document_info(doc) for doc in document_paths]
         generate_documents_py(documents, documents_py_path)
         print("\n✅ Documents metadata updated successfully!")
         return
@@ -390,18 +607,12 @@ def main():
         print(f"\n🗄️  Using existing vector store: {vector_store_id}")
 
         # Still need document info for documents.py
-        documents = [
-            DocumentInfo(
-                file_id="",
-                filename=doc.name,
-                title=generate_title(doc.name),
-                description=f"Knowledge base document: {generate_title(doc.name)}",
-            )
-            for doc in document_paths
-        ]
+        documents = [document_info(doc) for doc in document_paths]
     else:
         # Upload documents
-        documents = upload_documents(client, document_paths)
+        documents = asyncio.run(
+            upload_all(api_key, document_paths, concurrency=args.upload_concurrency)
+        )
 
         # Create vector store
         store_name = args.assistant_name or os.getenv("ASSISTANT_NAME", "Customer Knowledge Base")